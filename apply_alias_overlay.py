@@ -6,11 +6,10 @@ This script processes alias card images and applies the same point overlay
 as their corresponding original cards.
 """
 
-import json
 import os
 from pathlib import Path
 from typing import Dict, List
-from card_downloader import YugiohCardDownloader
+from card_downloader import YugiohCardDownloader, load_json_file
 
 
 class AliasOverlayProcessor:
@@ -48,8 +47,7 @@ class AliasOverlayProcessor:
         
     def _load_cards_data(self) -> Dict:
         """Load cards.json and create a lookup dictionary by code."""
-        with open(self.cards_json_path, 'r', encoding='utf-8') as f:
-            cards_list = json.load(f)
+        cards_list = load_json_file(self.cards_json_path)
         
         # Create a dictionary with code as key for quick lookup
         cards_dict = {}
@@ -61,8 +59,7 @@ class AliasOverlayProcessor:
     
     def _load_alias_data(self) -> Dict:
         """Load alias.json."""
-        with open(self.alias_json_path, 'r', encoding='utf-8') as f:
-            return json.load(f)
+        return load_json_file(self.alias_json_path)
     
     def process_all_aliases(self):
         """Process all alias cards and apply overlays."""
@@ -129,12 +126,8 @@ class AliasOverlayProcessor:
             True if successful, False otherwise
         """
         try:
-            # Read the image
-            with open(image_path, 'rb') as f:
-                image_data = f.read()
-            
             # Apply overlay using the downloader's method with 50% smaller font
-            modified_image_data = self.downloader.add_points_overlay(image_data, points, font_scale=0.5)
+            modified_image_data = self.downloader.add_points_overlay(image_path, points, font_scale=0.5)
             
             # Save to output directory
             output_path = self.output_dir / f"{alias_code}.jpg"
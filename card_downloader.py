@@ -6,85 +6,483 @@ This script downloads card images directly from YGOPRODeck using card codes
 from the cards.json file and adds point values as overlay text.
 """
 
+import functools
+import hashlib
 import json
+import logging
 import os
+import queue
+import shutil
 import sys
 import time
+import threading
 import requests
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from logging.handlers import QueueHandler, QueueListener
 from pathlib import Path
-from typing import List, Dict
+from typing import Any, List, Dict, Optional, Tuple, Union
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from PIL import Image, ImageDraw, ImageFont
 import io
 
+try:
+    import orjson as json_parser
+except ImportError:
+    # Optional speedup; stdlib json.loads also accepts UTF-8 bytes
+    json_parser = json
+
+# Shared by all scripts; messages are formatted lazily, only when emitted
+logger = logging.getLogger('cards')
+
+
+# Bump whenever render_points_overlay output changes so cached renders are rebuilt
+RENDER_VERSION = 2
+
+# Standard-mode size, based on the smaller alias images to keep file sizes down
+THUMBNAIL_SIZE = (177, 254)
+
+# Resampling filter used when shrinking cards to thumbnails. BICUBIC is
+# noticeably faster at a small cost in sharpness.
+RESAMPLE = Image.Resampling.LANCZOS
+
+FONT_PATHS = [
+    # macOS fonts (prefer bold for the points badge)
+    "/System/Library/Fonts/Supplemental/Arial Bold.ttf",
+    "/Library/Fonts/Arial Bold.ttf",
+    "/System/Library/Fonts/Supplemental/Arial.ttf",
+    "/System/Library/Fonts/Arial.ttf",
+    "/Library/Fonts/Arial.ttf",
+    # Windows fonts (prefer bold)
+    "C:/Windows/Fonts/arialbd.ttf",
+    "C:/Windows/Fonts/arial.ttf",
+    "C:/Windows/Fonts/Arial.ttf",
+    # Linux fonts
+    "/usr/share/fonts/truetype/dejavu/DejaVuSans-Bold.ttf",
+    "/usr/share/fonts/truetype/liberation/LiberationSans-Bold.ttf",
+]
+
+
+def setup_logging(level: int = logging.INFO) -> QueueListener:
+    """
+    Route the 'cards' logger to stdout through a queue.
+    
+    Worker threads format records and enqueue them (QueueHandler.prepare);
+    a single listener thread writes them, so workers never contend for the
+    stdout lock.
+    
+    Args:
+        level: Minimum level to emit
+        
+    Returns:
+        The started listener; call stop() before exiting to flush it.
+    """
+    log_queue = queue.SimpleQueue()
+    stream_handler = logging.StreamHandler(sys.stdout)
+    stream_handler.setFormatter(logging.Formatter('%(message)s'))
+    listener = QueueListener(log_queue, stream_handler)
+    
+    logger.addHandler(QueueHandler(log_queue))
+    logger.setLevel(level)
+    logger.propagate = False
+    listener.start()
+    return listener
+
+
+def load_json_file(path: Union[str, Path]) -> Any:
+    """
+    Parse a UTF-8 JSON file, using orjson when it is installed.
+    
+    Args:
+        path: Path to the JSON file
+        
+    Returns:
+        The parsed JSON data
+        
+    Raises:
+        json.JSONDecodeError: If the file is not valid JSON (orjson's error subclasses it)
+    """
+    with open(path, 'rb') as f:
+        return json_parser.loads(f.read())
+
+
+@functools.lru_cache(maxsize=None)
+def _find_font_path() -> Optional[str]:
+    """Return the first usable font in FONT_PATHS, probing the filesystem only once."""
+    for font_path in FONT_PATHS:
+        try:
+            ImageFont.truetype(font_path, 12)
+            return font_path
+        except (OSError, IOError):
+            continue
+    return None
+
+
+@functools.lru_cache(maxsize=32)
+def load_font(size: int):
+    """
+    Try to get a good font for text overlay.
+    Falls back to default font if system fonts are not available.
+    
+    Fonts are cached per size, so every card rendered at the same size
+    shares one loaded font instead of re-reading the font file.
+    """
+    font_path = _find_font_path()
+    if font_path:
+        try:
+            return ImageFont.truetype(font_path, size)
+        except (OSError, IOError):
+            pass
+    
+    # Fallback to default font
+    try:
+        return ImageFont.load_default()
+    except:
+        return None
+
+
+@functools.lru_cache(maxsize=16)
+def _badge_mask(size: Tuple[int, int], ellipse_size: Tuple[int, int], alpha: int) -> Image.Image:
+    """
+    Build the ellipse-shaped blend mask for the badge fill.
+    
+    Cards in a run share a handful of sizes, so masks are built once and
+    reused. Callers must treat the returned image as read-only.
+    
+    Args:
+        size: Mask size (width, height), i.e. the badge box clipped to the card
+        ellipse_size: Unclipped ellipse extent (x2 - x1, y2 - y1)
+        alpha: Fill opacity (0-255)
+        
+    Returns:
+        An 'L' mode mask image
+    """
+    mask = Image.new('L', size, 0)
+    ImageDraw.Draw(mask).ellipse([0, 0, ellipse_size[0], ellipse_size[1]], fill=alpha)
+    return mask
+
+
+@functools.lru_cache(maxsize=256)
+def _fit_points_font(diameter: int, text: str) -> Tuple[Optional[Union[ImageFont.FreeTypeFont, ImageFont.ImageFont]], int, int]:
+    """
+    Pick the font for a points badge and measure the text.
+    
+    Only a few badge sizes and points values occur in a run, so the
+    result is cached instead of re-measured for every card.
+    
+    Args:
+        diameter: Badge diameter in pixels
+        text: Points text to fit
+        
+    Returns:
+        Tuple of (font or None, text width, text height)
+    """
+    # Fit the number inside the circle: pick the largest font whose
+    # number fits within ~70% of the diameter (both width and height).
+    inner = diameter * 0.70
+    font_size = max(int(diameter * 0.6), 12)
+    font = load_font(font_size)
+    for _ in range(40):
+        if not font:
+            break
+        bbox = font.getbbox(text)
+        tw, th = bbox[2] - bbox[0], bbox[3] - bbox[1]
+        if (tw <= inner and th <= inner) or font_size <= 10:
+            break
+        font_size = max(int(font_size * 0.9), 10)
+        font = load_font(font_size)
+
+    # Final text dimensions
+    if font:
+        bbox = font.getbbox(text)
+        text_width = bbox[2] - bbox[0]
+        text_height = bbox[3] - bbox[1]
+    else:
+        # Estimate text size without font
+        font_size = 60
+        text_width = int(len(text) * (font_size * 0.6))
+        text_height = int(font_size)
+    return font, text_width, text_height
+
+
+def render_points_overlay(image_data: Union[bytes, str, Path], points: int, font_scale: float = 1.0, high_quality: bool = False, custom_quality: int = None, fallback_on_error: bool = True) -> bytes:
+    """
+    Render the points overlay onto an image.
+
+    Kept at module level (not a method) so it can be pickled and run in a
+    worker process.
+
+    Args:
+        image_data: Original image data as bytes, or a path to a local image file
+        points: Points value to overlay
+        font_scale: Scale factor for font size (default: 1.0)
+        high_quality: If True, keeps original image size. If False, resizes to thumbnail (default: False)
+        custom_quality: Optional JPEG quality override (0-100). If None, uses default logic.
+        fallback_on_error: If True, return the original image when rendering fails.
+            If False, re-raise so callers can tell a failed render from a real one.
+
+    Returns:
+        Modified image data as bytes
+
+    Raises:
+        Exception: Whatever rendering raised, only when fallback_on_error is False
+    """
+    try:
+        # Open image from bytes, or let Pillow read a local file directly
+        image = Image.open(io.BytesIO(image_data) if isinstance(image_data, bytes) else image_data)
+
+        # Only resize if NOT high quality. Image.open has only parsed the header
+        # at this point, so images that already fit skip thumbnail without any
+        # pixel decoding; pixels are first decoded when the badge is drawn.
+        if not high_quality:
+            max_width, max_height = THUMBNAIL_SIZE
+            if image.width > max_width or image.height > max_height:
+                # Use thumbnail to downscale images that are too large, preserving aspect ratio.
+                # Its default reducing_gap already draft-decodes JPEGs at a reduced DCT
+                # scale that stays at least 2x the target size.
+                image.thumbnail((max_width, max_height), RESAMPLE)
+
+        # Image dimensions
+        img_width, img_height = image.size
+
+        # Text to display
+        text = str(points)
+
+        # Badge geometry is proportional to the card width so the circle
+        # looks consistent across thumbnails and high-quality renders.
+        # font_scale is only used later to detect downloaded cards, not to
+        # size the badge.
+        diameter = max(int(img_width * 0.341), 71)
+
+        font, text_width, text_height = _fit_points_font(diameter, text)
+
+        # Position: flush against the bottom-left corner of the image.
+        rect_x1 = 0
+        rect_y2 = img_height
+        rect_y1 = rect_y2 - diameter
+        rect_x2 = rect_x1 + diameter
+
+        # Keep the badge inside the image (shift, don't squash, to stay circular)
+        if rect_x1 < 0:
+            rect_x2 -= rect_x1
+            rect_x1 = 0
+        if rect_y1 < 0:
+            rect_y2 -= rect_y1
+            rect_y1 = 0
+        rect_x2 = min(img_width, rect_x2)
+        rect_y2 = min(img_height, rect_y2)
+
+        # Single uniform style (no per-points colors):
+        # semi-transparent black circle with light-blue ring and white number.
+        bg_color = (0, 0, 0, 235)
+        ring_color = (93, 196, 234, 255)  # light blue (#5dc4ea)
+        text_color = (255, 255, 255)
+        ring_width = max(int(diameter * 0.07), 2)
+
+        if image.mode != 'RGB':
+            image = image.convert('RGB')
+
+        # Blend the semi-transparent fill in a single paste: the solid fill
+        # color goes through an ellipse-shaped mask holding the fill alpha,
+        # so only the badge region is touched and no RGBA copies are made.
+        badge_box = (rect_x1, rect_y1, min(rect_x2 + 1, img_width), min(rect_y2 + 1, img_height))
+        mask = _badge_mask(
+            (badge_box[2] - badge_box[0], badge_box[3] - badge_box[1]),
+            (rect_x2 - rect_x1, rect_y2 - rect_y1),
+            bg_color[3],
+        )
+        image.paste(bg_color[:3], badge_box, mask)
+
+        # The light-blue border ring is opaque, so draw it straight onto the card
+        draw = ImageDraw.Draw(image)
+        draw.ellipse([rect_x1, rect_y1, rect_x2, rect_y2], outline=ring_color[:3], width=ring_width)
+
+        # Draw text on top, positioned to be centered in the rectangle
+
+        # Calculate center of the rectangle
+        center_x = (rect_x1 + rect_x2) / 2
+        center_y = (rect_y1 + rect_y2) / 2
+
+        if font:
+            # Use anchor='mm' to center text exactly (middle-horizontal, middle-vertical)
+            try:
+                draw.text((center_x, center_y), text, fill=text_color, font=font, anchor='mm')
+            except ValueError:
+                # Fallback for older Pillow versions that might not support anchor
+                text_x = rect_x1 + (diameter - text_width) // 2
+                text_y = rect_y1 + (diameter - text_height) // 2
+                draw.text((text_x, text_y), text, fill=text_color, font=font)
+        else:
+            # Fallback for default font
+            text_x = rect_x1 + (diameter - text_width) // 2
+            text_y = rect_y1 + (diameter - text_height) // 2
+            draw.text((text_x, text_y), text, fill=text_color)
+
+        # Save to bytes
+        output_buffer = io.BytesIO()
+
+        # Determine quality: use custom if provided, otherwise 90 for HQ, 50 for Standard
+        final_quality = custom_quality if custom_quality is not None else (90 if high_quality else 50)
+
+        # Plain baseline encoding: optimize=True runs an extra pass to build Huffman
+        # tables, which more than doubles encode time for ~5% smaller files.
+        image.save(output_buffer, format='JPEG', quality=final_quality)
+
+        return output_buffer.getvalue()
+
+    except Exception as e:
+        if not fallback_on_error:
+            raise
+        logger.error("❌ Error adding points overlay: %s", e)
+        # Return original image data if overlay fails
+        if isinstance(image_data, bytes):
+            return image_data
+        with open(image_data, 'rb') as f:
+            return f.read()
+
+
+def render_cache_key(card_code: str, points: int, font_scale: float, high_quality: bool, custom_quality: Optional[int], source: str = '') -> str:
+    """
+    Build the render cache key for a card.
+    
+    Args:
+        card_code: The Yu-Gi-Oh! card ID
+        points: Points value to overlay
+        font_scale: Scale factor passed to the overlay
+        high_quality: High quality flag passed to the overlay
+        custom_quality: JPEG quality override passed to the overlay
+        source: Optional fingerprint of the source image (e.g. size + mtime of a local file)
+        
+    Returns:
+        Hex digest identifying this exact render
+    """
+    raw = f"{RENDER_VERSION}|{card_code}|{points}|{font_scale}|{high_quality}|{custom_quality}|{source}"
+    return hashlib.blake2b(raw.encode('utf-8'), digest_size=16).hexdigest()
+
 
 class YugiohCardDownloader:
     """Downloads Yu-Gi-Oh! card images directly from YGOPRODeck and adds Genesys point overlays."""
     
     BASE_IMAGE_URL = "https://images.ygoprodeck.com/images/cards"
     DEFAULT_OUTPUT_DIR = "downloaded_cards"
+    DEFAULT_WORKERS = 16
+    DEFAULT_CACHE_DIR = ".card_cache"
     
-    def __init__(self, output_dir: str = None, delay: float = 0.1):
+    def __init__(self, output_dir: str = None, delay: float = 0.1, workers: int = DEFAULT_WORKERS, cache_dir: Optional[str] = None):
         """
         Initialize the downloader.
         
         Args:
             output_dir: Directory to save downloaded images
-            delay: Delay between downloads to be respectful
+            delay: Minimum interval between request starts to be respectful
+            workers: Number of concurrent download workers
+            cache_dir: Directory for rendered images keyed by render_cache_key (disabled if None)
         """
         self.output_dir = Path(output_dir or self.DEFAULT_OUTPUT_DIR)
         self.delay = delay
+        self.workers = max(1, workers)
+        self.cache_dir = Path(cache_dir) if cache_dir else None
         self.session = requests.Session()
         self.session.headers.update({
-            'User-Agent': 'YuGiOh-Card-Downloader/2.0'
+            'User-Agent': 'YuGiOh-Card-Downloader/2.0',
+            # JPEGs are already compressed; don't negotiate gzip on top
+            'Accept-Encoding': 'identity',
+            'Connection': 'keep-alive',
         })
+
+        # Size the connection pool to the worker count so concurrent
+        # requests reuse persistent connections instead of queueing or
+        # reconnecting, and retry transient server errors with backoff
+        retry = Retry(total=3, backoff_factor=0.2, status_forcelist=[429, 502, 503, 504])
+        adapter = HTTPAdapter(pool_connections=self.workers, pool_maxsize=self.workers, max_retries=retry)
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+
+        # Request slots are handed out at least `delay` seconds apart
+        self._throttle_lock = threading.Lock()
+        self._next_request_at = 0.0
         
         # Create output directory if it doesn't exist
         self.output_dir.mkdir(exist_ok=True)
+        if self.cache_dir:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+
+    def throttle(self) -> None:
+        """
+        Block until the next request slot is available.
+
+        Slots are spaced `delay` seconds apart across all worker threads, so
+        the request rate stays polite while downloads overlap.
+        """
+        with self._throttle_lock:
+            now = time.monotonic()
+            wait = self._next_request_at - now
+            self._next_request_at = max(now, self._next_request_at) + self.delay
+        if wait > 0:
+            time.sleep(wait)
+        
+    def copy_from_cache(self, cache_key: str, output_path: Path) -> bool:
+        """
+        Copy a previously rendered image from the cache.
         
+        Args:
+            cache_key: Key from render_cache_key
+            output_path: Destination file
+            
+        Returns:
+            True on a cache hit, False if caching is disabled or the key is missing
+        """
+        if not self.cache_dir:
+            return False
+        cached_path = self.cache_dir / f"{cache_key}.jpg"
+        try:
+            shutil.copyfile(cached_path, output_path)
+        except FileNotFoundError:
+            return False
+        return True
+    
+    def store_in_cache(self, cache_key: str, image_data: bytes) -> None:
+        """
+        Store a rendered image in the cache.
+        
+        Args:
+            cache_key: Key from render_cache_key
+            image_data: Rendered JPEG bytes
+        """
+        if not self.cache_dir:
+            return
+        cached_path = self.cache_dir / f"{cache_key}.jpg"
+        # Write to a temp file and rename so an interrupted run never leaves a truncated entry
+        tmp_path = cached_path.with_name(f"{cached_path.name}.{threading.get_ident()}.tmp")
+        try:
+            with open(tmp_path, 'wb') as f:
+                f.write(image_data)
+            os.replace(tmp_path, cached_path)
+        except (OSError, IOError) as e:
+            # Don't leave a partial temp file behind (e.g. after ENOSPC)
+            try:
+                tmp_path.unlink()
+            except OSError:
+                pass
+            logger.warning("⚠️  Could not write render cache entry %s: %s", cached_path.name, e)
+    
     def load_cards_json(self, json_path: str) -> List[Dict]:
         """Load cards from JSON file."""
-        with open(json_path, 'r', encoding='utf-8') as f:
-            return json.load(f)
+        return load_json_file(json_path)
     
     def get_font(self, size: int):
         """
         Try to get a good font for text overlay.
         Falls back to default font if system fonts are not available.
         """
-        font_paths = [
-            # macOS fonts (prefer bold for the points badge)
-            "/System/Library/Fonts/Supplemental/Arial Bold.ttf",
-            "/Library/Fonts/Arial Bold.ttf",
-            "/System/Library/Fonts/Supplemental/Arial.ttf",
-            "/System/Library/Fonts/Arial.ttf",
-            "/Library/Fonts/Arial.ttf",
-            # Windows fonts (prefer bold)
-            "C:/Windows/Fonts/arialbd.ttf",
-            "C:/Windows/Fonts/arial.ttf",
-            "C:/Windows/Fonts/Arial.ttf",
-            # Linux fonts
-            "/usr/share/fonts/truetype/dejavu/DejaVuSans-Bold.ttf",
-            "/usr/share/fonts/truetype/liberation/LiberationSans-Bold.ttf",
-        ]
-        
-        for font_path in font_paths:
-            try:
-                return ImageFont.truetype(font_path, size)
-            except (OSError, IOError):
-                continue
-        
-        # Fallback to default font
-        try:
-            return ImageFont.load_default()
-        except:
-            return None
+        return load_font(size)
     
-    def add_points_overlay(self, image_data: bytes, points: int, font_scale: float = 1.0, high_quality: bool = False, custom_quality: int = None) -> bytes:
+    def add_points_overlay(self, image_data: Union[bytes, str, Path], points: int, font_scale: float = 1.0, high_quality: bool = False, custom_quality: int = None) -> bytes:
         """
         Add points overlay to the image.
         
         Args:
-            image_data: Original image data as bytes
+            image_data: Original image data as bytes, or a path to a local image file
             points: Points value to overlay
             font_scale: Scale factor for font size (default: 1.0)
             high_quality: If True, keeps original image size. If False, resizes to thumbnail (default: False)
@@ -93,142 +491,25 @@ class YugiohCardDownloader:
         Returns:
             Modified image data as bytes
         """
-        try:
-            # Open image from bytes
-            image = Image.open(io.BytesIO(image_data))
-            
-            # Define a max size based on smaller alias images to keep file sizes down
-            # Only resize if NOT high quality
-            if not high_quality:
-                max_width, max_height = 177, 254
-                if image.width > max_width or image.height > max_height:
-                    # Use thumbnail to downscale images that are too large, preserving aspect ratio
-                    image.thumbnail((max_width, max_height), Image.Resampling.LANCZOS)
-            
-            # Create a drawing context
-            draw = ImageDraw.Draw(image)
-            
-            # Image dimensions
-            img_width, img_height = image.size
-            
-            # Text to display
-            text = str(points)
-
-            # Badge geometry is proportional to the card width so the circle
-            # looks consistent across thumbnails and high-quality renders.
-            # font_scale is only used later to detect downloaded cards, not to
-            # size the badge.
-            diameter = max(int(img_width * 0.341), 71)
-
-            # Fit the number inside the circle: pick the largest font whose
-            # number fits within ~70% of the diameter (both width and height).
-            inner = diameter * 0.70
-            font_size = max(int(diameter * 0.6), 12)
-            font = self.get_font(font_size)
-            for _ in range(40):
-                if not font:
-                    break
-                bbox = draw.textbbox((0, 0), text, font=font)
-                tw, th = bbox[2] - bbox[0], bbox[3] - bbox[1]
-                if (tw <= inner and th <= inner) or font_size <= 10:
-                    break
-                font_size = max(int(font_size * 0.9), 10)
-                font = self.get_font(font_size)
-
-            # Final text dimensions
-            if font:
-                bbox = draw.textbbox((0, 0), text, font=font)
-                text_width = bbox[2] - bbox[0]
-                text_height = bbox[3] - bbox[1]
-            else:
-                # Estimate text size without font
-                font_size = 60
-                text_width = int(len(text) * (font_size * 0.6))
-                text_height = int(font_size)
-
-            # Position: flush against the bottom-left corner of the image.
-            rect_x1 = 0
-            rect_y2 = img_height
-            rect_y1 = rect_y2 - diameter
-            rect_x2 = rect_x1 + diameter
-
-            # Keep the badge inside the image (shift, don't squash, to stay circular)
-            if rect_x1 < 0:
-                rect_x2 -= rect_x1
-                rect_x1 = 0
-            if rect_y1 < 0:
-                rect_y2 -= rect_y1
-                rect_y1 = 0
-            rect_x2 = min(img_width, rect_x2)
-            rect_y2 = min(img_height, rect_y2)
-
-            # Single uniform style (no per-points colors):
-            # semi-transparent black circle with light-blue ring and white number.
-            bg_color = (0, 0, 0, 235)
-            ring_color = (93, 196, 234, 255)  # light blue (#5dc4ea)
-            text_color = (255, 255, 255)
-            ring_width = max(int(diameter * 0.07), 2)
-
-            # Create overlay for semi-transparent background
-            overlay = Image.new('RGBA', image.size, (0, 0, 0, 0))
-            overlay_draw = ImageDraw.Draw(overlay)
-
-            # Draw the circular badge with a light-blue border ring
-            overlay_draw.ellipse(
-                [rect_x1, rect_y1, rect_x2, rect_y2],
-                fill=bg_color,
-                outline=ring_color,
-                width=ring_width,
-            )
-            
-            # Composite the overlay onto the original image
-            if image.mode != 'RGBA':
-                image = image.convert('RGBA')
-            image = Image.alpha_composite(image, overlay)
-            
-            # Draw text on top, positioned to be centered in the rectangle
-            draw = ImageDraw.Draw(image)
-            
-            # Calculate center of the rectangle
-            center_x = (rect_x1 + rect_x2) / 2
-            center_y = (rect_y1 + rect_y2) / 2
-            
-            if font:
-                # Use anchor='mm' to center text exactly (middle-horizontal, middle-vertical)
-                try:
-                    draw.text((center_x, center_y), text, fill=text_color, font=font, anchor='mm')
-                except ValueError:
-                    # Fallback for older Pillow versions that might not support anchor
-                    text_x = rect_x1 + (diameter - text_width) // 2
-                    text_y = rect_y1 + (diameter - text_height) // 2
-                    draw.text((text_x, text_y), text, fill=text_color, font=font)
-            else:
-                # Fallback for default font
-                text_x = rect_x1 + (diameter - text_width) // 2
-                text_y = rect_y1 + (diameter - text_height) // 2
-                draw.text((text_x, text_y), text, fill=text_color)
-            
-            # Convert back to RGB if needed
-            if image.mode == 'RGBA':
-                # Create white background
-                rgb_image = Image.new('RGB', image.size, (255, 255, 255))
-                rgb_image.paste(image, mask=image.split()[-1])  # Use alpha channel as mask
-                image = rgb_image
-            
-            # Save to bytes with optimized compression
-            output_buffer = io.BytesIO()
-
-            # Determine quality: use custom if provided, otherwise 90 for HQ, 50 for Standard
-            final_quality = custom_quality if custom_quality is not None else (90 if high_quality else 50)
+        return render_points_overlay(image_data, points, font_scale, high_quality, custom_quality)
+    
+    def fetch_image(self, url: str) -> bytes:
+        """
+        Fetch raw image bytes over the shared, throttled session.
+        
+        Args:
+            url: Image URL
             
-            image.save(output_buffer, format='JPEG', quality=final_quality, optimize=True)
-                
-            return output_buffer.getvalue()
+        Returns:
+            The response body as bytes
             
-        except Exception as e:
-            print(f"❌ Error adding points overlay: {e}")
-            # Return original image data if overlay fails
-            return image_data
+        Raises:
+            requests.exceptions.RequestException: If the request fails
+        """
+        self.throttle()
+        response = self.session.get(url, timeout=30)
+        response.raise_for_status()
+        return response.content
     
     def download_image(self, url: str, filename: str, points: int) -> bool:
         """
@@ -243,11 +524,10 @@ class YugiohCardDownloader:
             True if successful, False otherwise
         """
         try:
-            response = self.session.get(url, timeout=30)
-            response.raise_for_status()
+            image_data = self.fetch_image(url)
             
             # Add points overlay to image
-            modified_image_data = self.add_points_overlay(response.content, points)
+            modified_image_data = self.add_points_overlay(image_data, points)
             
             # Save to file
             filepath = self.output_dir / filename
@@ -257,10 +537,10 @@ class YugiohCardDownloader:
             return True
             
         except requests.exceptions.RequestException as e:
-            print(f"❌ Error downloading image from {url}: {e}")
+            logger.error("❌ Error downloading image from %s: %s", url, e)
             return False
         except IOError as e:
-            print(f"❌ Error saving image to {filename}: {e}")
+            logger.error("❌ Error saving image to %s: %s", filename, e)
             return False
     
     def download_card_image(self, card_data: Dict) -> bool:
@@ -277,17 +557,17 @@ class YugiohCardDownloader:
         card_name = card_data.get('name', f'Card_{card_code}')
         points = card_data.get('points', 0)
         
-        print(f"📥 Downloading image for: {card_name} (ID: {card_code}, Points: {points})")
+        logger.info("📥 Downloading image for: %s (ID: %s, Points: %s)", card_name, card_code, points)
         
         # Construct direct image URL
         image_url = f"{self.BASE_IMAGE_URL}/{card_code}.jpg"
         filename = f"{card_code}.jpg"
         
         if self.download_image(image_url, filename, points):
-            print(f"  ✅ Downloaded with {points} points overlay: {filename}")
+            logger.info("  ✅ Downloaded with %s points overlay: %s", points, filename)
             return True
         else:
-            print(f"  ❌ Failed to download image for card {card_code}")
+            logger.error("  ❌ Failed to download image for card %s", card_code)
             return False
     
     def download_all_cards(self, json_path: str):
@@ -297,45 +577,58 @@ class YugiohCardDownloader:
         Args:
             json_path: Path to cards.json file
         """
-        print(f"🚀 Starting card image download...")
-        print(f"📁 Output directory: {self.output_dir.absolute()}")
+        logger.info("🚀 Starting card image download...")
+        logger.info("📁 Output directory: %s", self.output_dir.absolute())
         
         try:
             cards = self.load_cards_json(json_path)
         except (FileNotFoundError, json.JSONDecodeError) as e:
-            print(f"❌ Error loading cards JSON: {e}")
+            logger.error("❌ Error loading cards JSON: %s", e)
             return
         
         total_cards = len(cards)
         successful_downloads = 0
         failed_downloads = 0
         
-        print(f"📊 Found {total_cards} cards to process")
+        logger.info("📊 Found %s cards to process", total_cards)
         
+        valid_cards = []
         for i, card_data in enumerate(cards, 1):
-            card_code = card_data.get('code')
-            if not card_code:
-                print(f"❌ Card {i} missing code, skipping")
+            if not card_data.get('code'):
+                logger.error("❌ Card %s missing code, skipping", i)
                 failed_downloads += 1
                 continue
-            
-            print(f"\n[{i}/{total_cards}] Processing card {card_code}")
-            
-            # Download image
-            if self.download_card_image(card_data):
-                successful_downloads += 1
-            else:
-                failed_downloads += 1
-            
-            # Be respectful with downloads
-            if i < total_cards:  # Don't delay after the last card
-                time.sleep(self.delay)
+            valid_cards.append(card_data)
+        
+        # Downloads overlap across workers; throttle() keeps them spaced out
+        with ThreadPoolExecutor(max_workers=self.workers) as pool:
+            futures = {pool.submit(self.download_card_image, card_data): card_data for card_data in valid_cards}
+            try:
+                for i, future in enumerate(as_completed(futures), 1):
+                    card_code = futures[future]['code']
+                    try:
+                        success = future.result()
+                    except Exception as e:
+                        logger.error("❌ Unexpected error processing card %s: %s", card_code, e)
+                        success = False
+                
+                    if success:
+                        successful_downloads += 1
+                    else:
+                        failed_downloads += 1
+                    logger.info("[%s/%s] Processed card %s", i, len(valid_cards), card_code)
+            except BaseException:
+                # On Ctrl-C (or any error) drop queued work, so leaving the pool only
+                # waits for the cards already in flight
+                for f in futures:
+                    f.cancel()
+                raise
         
         # Final summary
-        print(f"\n🎉 Download completed!")
-        print(f"✅ Successfully downloaded: {successful_downloads} cards")
-        print(f"❌ Failed downloads: {failed_downloads} cards")
-        print(f"📁 Images saved to: {self.output_dir.absolute()}")
+        logger.info("\n🎉 Download completed!")
+        logger.info("✅ Successfully downloaded: %s cards", successful_downloads)
+        logger.info("❌ Failed downloads: %s cards", failed_downloads)
+        logger.info("📁 Images saved to: %s", self.output_dir.absolute())
 
 
 def main():
@@ -357,21 +650,32 @@ def main():
         '-d', '--delay',
         type=float,
         default=0.1,
-        help='Delay between downloads in seconds (default: 0.1)'
+        help='Minimum delay between download starts in seconds (default: 0.1)'
+    )
+    parser.add_argument(
+        '-w', '--workers',
+        type=int,
+        default=YugiohCardDownloader.DEFAULT_WORKERS,
+        help=f'Number of concurrent downloads (default: {YugiohCardDownloader.DEFAULT_WORKERS})'
     )
     
     args = parser.parse_args()
     
-    if not os.path.exists(args.file):
-        print(f"❌ Cards JSON file not found: {args.file}")
-        sys.exit(1)
-    
-    downloader = YugiohCardDownloader(
-        output_dir=args.output,
-        delay=args.delay
-    )
-    
-    downloader.download_all_cards(args.file)
+    listener = setup_logging()
+    try:
+        if not os.path.exists(args.file):
+            logger.error("❌ Cards JSON file not found: %s", args.file)
+            sys.exit(1)
+        
+        downloader = YugiohCardDownloader(
+            output_dir=args.output,
+            delay=args.delay,
+            workers=args.workers
+        )
+        
+        downloader.download_all_cards(args.file)
+    finally:
+        listener.stop()
 
 
 if __name__ == '__main__':
@@ -10,17 +10,23 @@ All generated images are saved to a single output directory with consistent over
 """
 
 import json
+import logging
+import multiprocessing
 import os
 import sys
-import time
 import shutil
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor, as_completed
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Set
+
+logger = logging.getLogger('cards')
 
 
 class CardRegenerator:
     """Orchestrates the full card regeneration process."""
 
+    MANIFEST_NAME = ".manifest.json"
+
     def __init__(
         self,
         cards_path: str,
@@ -30,6 +36,10 @@ class CardRegenerator:
         delay: float,
         generation: str = "all",
         codes: Optional[List[str]] = None,
+        workers: int = 16,
+        cache_dir: Optional[str] = None,
+        no_overlay_on_zero: bool = False,
+        clean: bool = False,
     ):
         """
         Initialize the regenerator.
@@ -39,14 +49,24 @@ class CardRegenerator:
             alias_path: Path to alias.json
             alias_images_dir: Directory with pre-downloaded alias images
             output_dir: Directory to save all generated cards
-            delay: Delay between downloads
+            delay: Minimum delay between download starts
             generation: What to generate: all, cards, alias
+            codes: Optional list of card codes to restrict generation to
+            workers: Number of concurrent download workers
+            cache_dir: Directory for cached renders (disabled if None)
+            no_overlay_on_zero: Copy alias images of 0-point cards unchanged instead of rendering a badge
+            clean: Delete the output directory first and ignore cached renders, re-rendering every card
         """
         self.cards_path = Path(cards_path)
         self.alias_path = Path(alias_path) if alias_path else None
         self.alias_images_dir = Path(alias_images_dir) if alias_images_dir else None
         self.output_dir = Path(output_dir)
         self.delay = delay
+        self.workers = max(1, workers)
+        self.no_overlay_on_zero = no_overlay_on_zero
+        # The primary key has no fingerprint of the remote art, so a clean run must
+        # bypass cached renders to pick up updated images; fresh renders still refresh the cache
+        self.reuse_cache = not clean
         self.generation = generation
         self.codes_filter = {str(c) for c in (codes or [])} or None
 
@@ -54,33 +74,87 @@ class CardRegenerator:
         from card_downloader import YugiohCardDownloader
 
         # This will be used for applying overlays and for downloading
-        self.downloader = YugiohCardDownloader(output_dir=str(self.output_dir), delay=self.delay)
+        self.downloader = YugiohCardDownloader(
+            output_dir=str(self.output_dir), delay=self.delay, workers=self.workers, cache_dir=cache_dir
+        )
 
         # Load data
         self.cards_data = self._load_cards_data()
         self.alias_data = self._load_alias_data() if self.alias_path else {}
 
-        # Clean and recreate the output directory
-        if self.output_dir.exists():
-            print(f"🧹 Cleaning output directory: {self.output_dir.absolute()}")
+        # Only wipe the output directory on request; by default it is updated in place
+        if clean and self.output_dir.exists():
+            logger.info("🧹 Cleaning output directory: %s", self.output_dir.absolute())
             shutil.rmtree(self.output_dir)
 
         # Create output directory
         self.output_dir.mkdir(parents=True, exist_ok=True)
-        print(f"💾 Output will be saved to: {self.output_dir.absolute()}")
+        logger.info("💾 Output will be saved to: %s", self.output_dir.absolute())
+
+        # Render keys of the files written by previous runs, per phase
+        self.manifest = self._load_manifest()
 
     def _load_cards_data(self) -> Dict:
         """Load cards.json and create a lookup dictionary by code."""
-        with open(self.cards_path, 'r', encoding='utf-8') as f:
-            cards_list = json.load(f)
+        from card_downloader import load_json_file
+
+        cards_list = load_json_file(self.cards_path)
         return {str(card.get('code')): card for card in cards_list}
 
     def _load_alias_data(self) -> Dict:
         """Load alias.json."""
         if not self.alias_path:
             return {}
-        with open(self.alias_path, 'r', encoding='utf-8') as f:
-            return json.load(f)
+        from card_downloader import load_json_file
+
+        return load_json_file(self.alias_path)
+
+    def _load_manifest(self) -> Dict[str, Dict[str, str]]:
+        """Load the output manifest mapping each generated file to its render key."""
+        manifest_path = self.output_dir / self.MANIFEST_NAME
+        manifest: Dict[str, Dict[str, str]] = {'cards': {}, 'alias': {}}
+        if not manifest_path.exists():
+            return manifest
+
+        from card_downloader import load_json_file
+
+        try:
+            data = load_json_file(manifest_path)
+        except (OSError, ValueError) as e:
+            logger.warning("⚠️  Ignoring unreadable manifest %s: %s", manifest_path, e)
+            return manifest
+        for section in manifest:
+            manifest[section].update(data.get(section, {}))
+        return manifest
+
+    def _save_manifest(self) -> None:
+        """Atomically write the output manifest."""
+        manifest_path = self.output_dir / self.MANIFEST_NAME
+        tmp_path = manifest_path.with_name(f"{manifest_path.name}.tmp")
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(self.manifest, f, indent=2, sort_keys=True)
+        os.replace(tmp_path, manifest_path)
+
+    def _prune_stale_outputs(self, section: str, expected: Set[str]) -> int:
+        """
+        Delete previously generated files that are no longer part of the data.
+
+        Args:
+            section: Manifest section ('cards' or 'alias')
+            expected: Filenames that the current data can still produce
+
+        Returns:
+            Number of files removed.
+        """
+        entries = self.manifest[section]
+        stale = [filename for filename in entries if filename not in expected]
+        for filename in stale:
+            try:
+                (self.output_dir / filename).unlink()
+            except FileNotFoundError:
+                pass
+            del entries[filename]
+        return len(stale)
 
     def run_regeneration(self, limit: int = None, high_quality: bool = False):
         """Execute regeneration process based on generation scope."""
@@ -88,9 +162,9 @@ class CardRegenerator:
         font_scale = 1.40 if high_quality else 0.70
         
         if high_quality:
-            print("✨ High Quality Mode: ON (Original image sizes)")
+            logger.info("✨ High Quality Mode: ON (Original image sizes)")
         else:
-            print("📉 Standard Mode: ON (Optimized/Thumbnail sizes)")
+            logger.info("📉 Standard Mode: ON (Optimized/Thumbnail sizes)")
 
         if self.generation in ("all", "cards"):
             self.process_primary_cards(limit=limit, font_scale=font_scale, high_quality=high_quality)
@@ -99,100 +173,212 @@ class CardRegenerator:
             # Phase 2: Alias Cards
             # Alias cards always use the specific font scale, but we match the
             # high_quality flag to preserve image fidelity if requested (no resize/compression).
-            print(
-                f"\nℹ️  Alias cards will be processed with Scale 0.70 and Quality: {'High' if high_quality else 'Standard'}"
+            logger.info(
+                "\nℹ️  Alias cards will be processed with Scale 0.70 and Quality: %s",
+                'High' if high_quality else 'Standard',
             )
             self.process_alias_cards(font_scale=0.70, high_quality=high_quality)
         
         if self.generation == "cards":
-            print("\n🎉 Card generation completed (cards only)!")
+            logger.info("\n🎉 Card generation completed (cards only)!")
         elif self.generation == "alias":
-            print("\n🎉 Card generation completed (alias only)!")
+            logger.info("\n🎉 Card generation completed (alias only)!")
         else:
-            print("\n🎉 Full regeneration process completed!")
+            logger.info("\n🎉 Full regeneration process completed!")
+
+    def _create_render_pool(self) -> ProcessPoolExecutor:
+        """
+        Create the process pool used for overlay rendering.
+
+        The CPU-bound overlay runs in separate processes so it isn't
+        serialized by the GIL. "spawn" avoids forking while worker threads
+        are running; processes only start once work is actually submitted.
+
+        Returns:
+            A ProcessPoolExecutor sized to the CPU count
+        """
+        return ProcessPoolExecutor(
+            max_workers=os.cpu_count() or 1, mp_context=multiprocessing.get_context('spawn')
+        )
 
     def process_primary_cards(self, limit: int = None, font_scale: float = 0.5, high_quality: bool = False):
         """Phase 1: Download and apply overlays for cards in cards.json."""
-        print("\n--- Phase 1: Processing Primary Cards (from cards.json) ---")
+        logger.info("\n--- Phase 1: Processing Primary Cards (from cards.json) ---")
         
         cards_to_process = list(self.cards_data.items())
         if self.codes_filter:
             cards_to_process = [(code, data) for (code, data) in cards_to_process if code in self.codes_filter]
             missing = sorted(self.codes_filter.difference(self.cards_data.keys()))
             if missing:
-                print(f"❌ Error: The following --code values were not found in cards.json: {', '.join(missing)}")
+                logger.error("❌ Error: The following --code values were not found in cards.json: %s", ', '.join(missing))
                 sys.exit(1)
 
         if limit:
-            print(f"⚠️  Processing a limited set of {limit} cards for this test run.")
+            logger.warning("⚠️  Processing a limited set of %s cards for this test run.", limit)
             cards_to_process = cards_to_process[:limit]
 
-        total_cards = len(cards_to_process)
-        success_count = 0
-        
-        for i, (card_code, card_data) in enumerate(cards_to_process, 1):
-            points = card_data.get('points', 0)
-            name = card_data.get('name', f"Card {card_code}")
-            
-            print(f"[{i}/{total_cards}] Downloading: {name} (Code: {card_code}, Points: {points})")
-
-            # We use the downloader's direct image URL and session
-            image_url = f"{self.downloader.BASE_IMAGE_URL}/{card_code}.jpg"
+        from card_downloader import render_cache_key
+
+        # Skip cards whose output was already rendered with the same key
+        manifest = self.manifest['cards']
+        pending = []
+        up_to_date_count = 0
+        for card_code, card_data in cards_to_process:
+            # Use custom_quality=50 to keep file size down even in HQ mode (since images are large)
+            cache_key = render_cache_key(card_code, card_data.get('points', 0), font_scale, high_quality, 50)
             filename = f"{card_code}.jpg"
-            output_path = self.output_dir / filename
+            if manifest.get(filename) == cache_key and (self.output_dir / filename).exists():
+                up_to_date_count += 1
+                continue
+            pending.append((card_code, card_data, cache_key))
 
+        total_cards = len(pending)
+        success_count = 0
+        cached_count = 0
+        failed_count = 0
+        if up_to_date_count > 0:
+            logger.info("⏭️  %s cards already up to date", up_to_date_count)
+        logger.info("🚀 Downloading %s cards with %s workers", total_cards, self.workers)
+
+        # Threads fetch bytes while the overlay renders in separate processes
+        with self._create_render_pool() as render_pool, ThreadPoolExecutor(max_workers=self.workers) as pool:
+            futures = {
+                pool.submit(
+                    self._process_primary_card, card_code, card_data, cache_key, font_scale, high_quality, render_pool
+                ): (card_code, cache_key)
+                for card_code, card_data, cache_key in pending
+            }
             try:
-                # 1. Download image
-                response = self.downloader.session.get(image_url, timeout=30)
-                response.raise_for_status()
-                
-                # 2. Apply overlay with consistent settings
-                # Use custom_quality=50 to keep file size down even in HQ mode (since images are large)
-                modified_image_data = self.downloader.add_points_overlay(
-                    response.content, points, font_scale=font_scale, high_quality=high_quality, custom_quality=50
-                )
+                for i, future in enumerate(as_completed(futures), 1):
+                    card_code, cache_key = futures[future]
+                    card_data = self.cards_data[card_code]
+                    points = card_data.get('points', 0)
+                    name = card_data.get('name', f"Card {card_code}")
+
+                    try:
+                        from_cache = future.result()
+                    except Exception as e:
+                        logger.error("[%s/%s] ❌ FAILED to process %s: %s", i, total_cards, card_code, e)
+                        failed_count += 1
+                        continue
+
+                    if from_cache:
+                        logger.info(
+                            "[%s/%s] ♻️  Reused cached: %s.jpg (%s, Points: %s)", i, total_cards, card_code, name, points
+                        )
+                        cached_count += 1
+                    else:
+                        logger.info("[%s/%s] ✅ Generated: %s.jpg (%s, Points: %s)", i, total_cards, card_code, name, points)
+                    manifest[f"{card_code}.jpg"] = cache_key
+                    success_count += 1
+            except BaseException:
+                # On Ctrl-C (or any error) drop queued work, so leaving the pool only
+                # waits for the cards already in flight
+                for f in futures:
+                    f.cancel()
+                raise
+
+        removed_count = self._prune_stale_outputs('cards', {f"{code}.jpg" for code in self.cards_data})
+        self._save_manifest()
+
+        logger.info("\n--- Phase 1 Summary ---")
+        logger.info("✅ Successfully generated: %s/%s primary cards", success_count, total_cards)
+        if up_to_date_count > 0:
+            logger.info("⏭️  Already up to date: %s primary cards", up_to_date_count)
+        if cached_count > 0:
+            logger.info("♻️  Reused from cache: %s primary cards", cached_count)
+        if failed_count > 0:
+            logger.error("❌ Failed: %s primary cards (retried on the next run)", failed_count)
+        if removed_count > 0:
+            logger.info("🧹 Removed: %s cards no longer in cards.json", removed_count)
+
+
+    def _process_primary_card(
+        self,
+        card_code: str,
+        card_data: Dict,
+        cache_key: str,
+        font_scale: float,
+        high_quality: bool,
+        render_pool: Executor,
+    ) -> bool:
+        """
+        Download a single primary card, apply its overlay and save it.
+
+        Runs on a worker thread; errors propagate to the caller's future.
+
+        Args:
+            card_code: The Yu-Gi-Oh! card ID
+            card_data: Card entry from cards.json
+            cache_key: Render cache key for this card
+            font_scale: Scale factor for the overlay font
+            high_quality: If True, keeps the original image size
+            render_pool: Executor that runs the overlay rendering
+
+        Returns:
+            True if the image was reused from the render cache, False if it was rendered.
+        """
+        from card_downloader import render_points_overlay
+
+        points = card_data.get('points', 0)
 
-                # 3. Save to the unified output directory
-                with open(output_path, 'wb') as f:
-                    f.write(modified_image_data)
-                
-                print(f"  ✅ Generated: {filename}")
-                success_count += 1
+        # We use the downloader's direct image URL and session
+        image_url = f"{self.downloader.BASE_IMAGE_URL}/{card_code}.jpg"
+        output_path = self.output_dir / f"{card_code}.jpg"
 
-            except Exception as e:
-                print(f"  ❌ FAILED to process {card_code}: {e}")
+        # Unchanged cards are copied from the render cache without downloading
+        if self.reuse_cache and self.downloader.copy_from_cache(cache_key, output_path):
+            return True
 
-            if i < total_cards:
-                time.sleep(self.delay)
+        # 1. Download image
+        image_data = self.downloader.fetch_image(image_url)
 
-        print(f"\n--- Phase 1 Summary ---")
-        print(f"✅ Successfully generated: {success_count}/{total_cards} primary cards")
+        # 2. Apply overlay with consistent settings (quality 50, matching the cache key).
+        # A failed render raises instead of returning the source bytes, so it is
+        # reported as FAILED and kept out of the cache and manifest to be retried.
+        modified_image_data = render_pool.submit(
+            render_points_overlay, image_data, points, font_scale, high_quality, 50, fallback_on_error=False
+        ).result()
 
+        # 3. Save to the unified output directory
+        with open(output_path, 'wb') as f:
+            f.write(modified_image_data)
+
+        self.downloader.store_in_cache(cache_key, modified_image_data)
+        return False
 
     def process_alias_cards(self, font_scale: float = 0.5, high_quality: bool = False):
         """Phase 2: Apply overlays for alias cards from alias.json."""
-        print("\n--- Phase 2: Processing Alias Cards (from alias.json) ---")
+        logger.info("\n--- Phase 2: Processing Alias Cards (from alias.json) ---")
         if not self.alias_images_dir:
-            print("❌ Error: alias_images_dir was not provided, cannot process aliases.")
+            logger.error("❌ Error: alias_images_dir was not provided, cannot process aliases.")
             return
         if not self.alias_data:
-            print("⚠️  No alias data loaded (alias.json missing or empty), nothing to do.")
+            logger.warning("⚠️  No alias data loaded (alias.json missing or empty), nothing to do.")
             return
         alias_items = list(self.alias_data.items())
         if self.codes_filter:
             # Only process aliases for the requested original card codes
             alias_items = [(k, v) for (k, v) in alias_items if str(k) in self.codes_filter]
             if not alias_items:
-                print("ℹ️  No aliases found for the provided --code value(s).")
+                logger.info("ℹ️  No aliases found for the provided --code value(s).")
                 return
 
+        from card_downloader import render_cache_key
+
         total_aliases = sum(len(v) for _, v in alias_items)
         processed_count = 0
+        cached_count = 0
         skipped_count = 0
+        up_to_date_count = 0
+        failed_count = 0
+        manifest = self.manifest['alias']
 
+        # Resolve which alias images exist up front, then fan the work out
+        alias_jobs = []
         for original_code, alias_list in alias_items:
             if original_code not in self.cards_data:
-                print(f"⚠️  Original card {original_code} not found, skipping its aliases")
+                logger.warning("⚠️  Original card %s not found, skipping its aliases", original_code)
                 skipped_count += len(alias_list)
                 continue
 
@@ -200,42 +386,152 @@ class CardRegenerator:
             points = original_card.get('points', 0)
             name = original_card.get('name', f"Card {original_code}")
 
-            print(f"Processing aliases for: {name} (Code: {original_code}, Points: {points})")
-
             for alias_code in alias_list:
                 alias_code_str = str(alias_code)
                 image_path = self.alias_images_dir / f"{alias_code_str}.jpg"
-                output_path = self.output_dir / f"{alias_code_str}.jpg"
 
                 if not image_path.exists():
-                    print(f"  ⚠️  Image not found for alias {alias_code_str}, skipping.")
+                    logger.warning("  ⚠️  Image not found for alias %s, skipping.", alias_code_str)
                     skipped_count += 1
                     continue
-                
-                try:
-                    # 1. Read the local image file
-                    with open(image_path, 'rb') as f:
-                        image_data = f.read()
-
-                    # 2. Apply overlay with consistent settings
-                    modified_image_data = self.downloader.add_points_overlay(
-                        image_data, points, font_scale=font_scale, high_quality=high_quality
-                    )
-                    
-                    # 3. Save to the unified output directory
-                    with open(output_path, 'wb') as f:
-                        f.write(modified_image_data)
-
-                    print(f"  ✅ Generated: {alias_code_str}.jpg")
-                    processed_count += 1
 
-                except Exception as e:
-                    print(f"  ❌ FAILED to process alias {alias_code_str}: {e}")
+                # The key covers the points, settings and source image, so an
+                # unchanged entry in the manifest means the output is current
+                source_stat = image_path.stat()
+                source = f"{source_stat.st_size}:{source_stat.st_mtime_ns}"
+                passthrough = points == 0 and self.no_overlay_on_zero
+                if passthrough:
+                    source += ":passthrough"
+                cache_key = render_cache_key(alias_code_str, points, font_scale, high_quality, None, source=source)
+                filename = f"{alias_code_str}.jpg"
+                if manifest.get(filename) == cache_key and (self.output_dir / filename).exists():
+                    up_to_date_count += 1
+                    continue
 
-        print(f"\n--- Phase 2 Summary ---")
-        print(f"✅ Successfully generated: {processed_count} alias cards")
+                alias_jobs.append((alias_code_str, name, points, image_path, cache_key, passthrough))
+
+        total_jobs = len(alias_jobs)
+        if up_to_date_count > 0:
+            logger.info("⏭️  %s alias images already up to date", up_to_date_count)
+        logger.info("🚀 Processing %s alias images", total_jobs)
+
+        # Local reads/writes overlap on threads while overlays render in processes
+        with self._create_render_pool() as render_pool, ThreadPoolExecutor(max_workers=self.workers) as pool:
+            futures = {
+                pool.submit(
+                    self._process_alias_card,
+                    alias_code_str, points, image_path, cache_key, passthrough, font_scale, high_quality, render_pool,
+                ): (alias_code_str, name, points, cache_key)
+                for alias_code_str, name, points, image_path, cache_key, passthrough in alias_jobs
+            }
+            try:
+                for i, future in enumerate(as_completed(futures), 1):
+                    alias_code_str, name, points, cache_key = futures[future]
+
+                    try:
+                        from_cache = future.result()
+                    except Exception as e:
+                        logger.error("[%s/%s] ❌ FAILED to process alias %s: %s", i, total_jobs, alias_code_str, e)
+                        failed_count += 1
+                        continue
+
+                    if from_cache:
+                        logger.info(
+                            "[%s/%s] ♻️  Reused cached: %s.jpg (alias of %s, Points: %s)",
+                            i, total_jobs, alias_code_str, name, points,
+                        )
+                        cached_count += 1
+                    else:
+                        logger.info(
+                            "[%s/%s] ✅ Generated: %s.jpg (alias of %s, Points: %s)",
+                            i, total_jobs, alias_code_str, name, points,
+                        )
+                    manifest[f"{alias_code_str}.jpg"] = cache_key
+                    processed_count += 1
+            except BaseException:
+                # On Ctrl-C (or any error) drop queued work, so leaving the pool only
+                # waits for the aliases already in flight
+                for f in futures:
+                    f.cancel()
+                raise
+
+        expected_aliases = {
+            f"{alias_code}.jpg"
+            for original_code, alias_list in self.alias_data.items()
+            if original_code in self.cards_data
+            for alias_code in alias_list
+            if (self.alias_images_dir / f"{alias_code}.jpg").exists()
+        }
+        removed_count = self._prune_stale_outputs('alias', expected_aliases)
+        self._save_manifest()
+
+        logger.info("\n--- Phase 2 Summary ---")
+        logger.info("✅ Successfully generated: %s alias cards", processed_count)
+        if up_to_date_count > 0:
+            logger.info("⏭️  Already up to date: %s alias cards", up_to_date_count)
+        if cached_count > 0:
+            logger.info("♻️  Reused from cache: %s alias cards", cached_count)
+        if failed_count > 0:
+            logger.error("❌ Failed: %s alias cards (retried on the next run)", failed_count)
+        if removed_count > 0:
+            logger.info("🧹 Removed: %s alias cards no longer in alias.json", removed_count)
         if skipped_count > 0:
-            print(f"⚠️  Skipped: {skipped_count} alias cards (image not found)")
+            logger.warning("⚠️  Skipped: %s alias cards (image not found)", skipped_count)
+
+    def _process_alias_card(
+        self,
+        alias_code: str,
+        points: int,
+        image_path: Path,
+        cache_key: str,
+        passthrough: bool,
+        font_scale: float,
+        high_quality: bool,
+        render_pool: Executor,
+    ) -> bool:
+        """
+        Apply the overlay to a single local alias image and save it.
+
+        Runs on a worker thread; errors propagate to the caller's future.
+
+        Args:
+            alias_code: The alias card ID
+            points: Points value of the original card
+            image_path: Path to the pre-downloaded alias image
+            cache_key: Render cache key for this alias
+            passthrough: Copy the source image unchanged instead of rendering a badge
+            font_scale: Scale factor for the overlay font
+            high_quality: If True, keeps the original image size
+            render_pool: Executor that runs the overlay rendering
+
+        Returns:
+            True if the image was reused from the render cache, False if it was rendered.
+        """
+        from card_downloader import render_points_overlay
+
+        output_path = self.output_dir / f"{alias_code}.jpg"
+
+        # Pass-through: copyfile uses in-kernel copies (sendfile/fcopyfile) where available
+        if passthrough:
+            shutil.copyfile(image_path, output_path)
+            return False
+
+        # Reuse the cached render unless the points, settings or source image changed
+        if self.reuse_cache and self.downloader.copy_from_cache(cache_key, output_path):
+            return True
+
+        # 1. Apply overlay with consistent settings (Pillow reads the local file itself).
+        # A failed render raises so it is retried next run rather than cached.
+        modified_image_data = render_pool.submit(
+            render_points_overlay, image_path, points, font_scale, high_quality, None, fallback_on_error=False
+        ).result()
+
+        # 2. Save to the unified output directory
+        with open(output_path, 'wb') as f:
+            f.write(modified_image_data)
+
+        self.downloader.store_in_cache(cache_key, modified_image_data)
+        return False
 
 
 def main():
@@ -261,7 +557,20 @@ def main():
     )
     parser.add_argument(
         '-d', '--delay', type=float, default=0.1,
-        help='Delay between downloads in seconds (default: 0.1)'
+        help='Minimum delay between download starts in seconds (default: 0.1)'
+    )
+    parser.add_argument(
+        '-w', '--workers', type=int, default=16,
+        help='Number of concurrent downloads (default: 16)'
+    )
+    parser.add_argument(
+        '--cache-dir', default='.card_cache',
+        help='Directory where rendered cards are cached between runs (default: .card_cache)'
+    )
+    parser.add_argument(
+        '--no-cache',
+        action='store_true',
+        help='Disable the render cache (up-to-date outputs are still skipped; use --clean to re-render everything)'
     )
     parser.add_argument(
         '-l', '--limit', type=int, default=None,
@@ -280,6 +589,16 @@ def main():
         choices=['all', 'cards', 'alias'],
         help="What to generate: all, cards, alias (default: all)"
     )
+    parser.add_argument(
+        '--clean',
+        action='store_true',
+        help='Delete the output directory and ignore cached renders, re-downloading and re-rendering every card'
+    )
+    parser.add_argument(
+        '--no-overlay-on-zero',
+        action='store_true',
+        help='Copy alias images of 0-point cards unchanged instead of drawing a "0" badge'
+    )
     parser.add_argument(
         '--code',
         action='append',
@@ -290,42 +609,53 @@ def main():
 
     args = parser.parse_args()
 
-    if args.generate == 'alias' and args.limit is not None:
-        print("ℹ️  Note: --limit only applies to primary cards (cards.json). It is ignored when --generate=alias.")
+    # Import here so `--help` works even without deps installed
+    from card_downloader import setup_logging
 
-    # Parse --code (supports multiple flags and/or comma-separated lists)
-    codes: Optional[List[str]] = None
-    if args.code:
-        parsed: List[str] = []
-        for raw in args.code:
-            if raw is None:
-                continue
-            for part in str(raw).split(','):
-                part = part.strip()
-                if part:
-                    parsed.append(part)
-        codes = parsed or None
-
-    # Validate paths
-    required_paths = [args.cards]
-    if args.generate in ('all', 'alias'):
-        required_paths.extend([args.alias, args.alias_images])
-    for path in required_paths:
-        if not os.path.exists(path):
-            print(f"❌ Error: Required file or directory not found: {path}")
-            sys.exit(1)
-
-    regenerator = CardRegenerator(
-        cards_path=args.cards,
-        alias_path=args.alias if args.generate in ('all', 'alias') else None,
-        alias_images_dir=args.alias_images if args.generate in ('all', 'alias') else None,
-        output_dir=args.output,
-        delay=args.delay,
-        generation=args.generate,
-        codes=codes,
-    )
+    listener = setup_logging()
+    try:
+        if args.generate == 'alias' and args.limit is not None:
+            logger.info("ℹ️  Note: --limit only applies to primary cards (cards.json). It is ignored when --generate=alias.")
+
+        # Parse --code (supports multiple flags and/or comma-separated lists)
+        codes: Optional[List[str]] = None
+        if args.code:
+            parsed: List[str] = []
+            for raw in args.code:
+                if raw is None:
+                    continue
+                for part in str(raw).split(','):
+                    part = part.strip()
+                    if part:
+                        parsed.append(part)
+            codes = parsed or None
+
+        # Validate paths
+        required_paths = [args.cards]
+        if args.generate in ('all', 'alias'):
+            required_paths.extend([args.alias, args.alias_images])
+        for path in required_paths:
+            if not os.path.exists(path):
+                logger.error("❌ Error: Required file or directory not found: %s", path)
+                sys.exit(1)
+
+        regenerator = CardRegenerator(
+            cards_path=args.cards,
+            alias_path=args.alias if args.generate in ('all', 'alias') else None,
+            alias_images_dir=args.alias_images if args.generate in ('all', 'alias') else None,
+            output_dir=args.output,
+            delay=args.delay,
+            generation=args.generate,
+            codes=codes,
+            workers=args.workers,
+            cache_dir=None if args.no_cache else args.cache_dir,
+            no_overlay_on_zero=args.no_overlay_on_zero,
+            clean=args.clean,
+        )
     
-    regenerator.run_regeneration(limit=args.limit, high_quality=args.high_quality)
+        regenerator.run_regeneration(limit=args.limit, high_quality=args.high_quality)
+    finally:
+        listener.stop()
 
 
 if __name__ == '__main__':
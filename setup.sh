@@ -26,6 +26,23 @@ source "$VENV_DIR/bin/activate"
 python3 -m pip install --upgrade pip
 python3 -m pip install -r requirements.txt
 
+# Optional: swap Pillow for the SIMD-accelerated drop-in fork (x86 + C compiler required).
+# Build the wheel first so a failed build leaves the working Pillow install in place.
+if [ "${PILLOW_SIMD:-0}" = "1" ]; then
+  echo "Building Pillow-SIMD..."
+  WHEEL_DIR="$(mktemp -d)"
+  if CC="cc -mavx2" python3 -m pip wheel --no-deps --no-binary pillow-simd -w "$WHEEL_DIR" pillow-simd; then
+    echo "Replacing Pillow with Pillow-SIMD..."
+    python3 -m pip uninstall -y pillow
+    python3 -m pip install --no-index --find-links "$WHEEL_DIR" pillow-simd
+  else
+    echo "WARNING: Pillow-SIMD build failed, keeping the standard Pillow install."
+  fi
+  rm -rf "$WHEEL_DIR"
+fi
+
+python3 -c "from PIL import features; print('libjpeg-turbo:', 'yes' if features.check_feature('libjpeg_turbo') else 'no')"
+
 echo ""
 echo "Setup completed!"
 echo ""